@@ -1,14 +1,33 @@
-from flask import Flask, jsonify, request
+from flask import Flask, request
 from flask_cors import CORS
+from flask_compress import Compress
 import cassandra.cluster
 import cassandra.util
+from cassandra import ConsistencyLevel
+from cassandra.cluster import ExecutionProfile, EXEC_PROFILE_DEFAULT, ResultSet
+from cassandra.policies import TokenAwarePolicy, DCAwareRoundRobinPolicy
+from cassandra.query import dict_factory
+from cachetools import TTLCache
+import gzip
+import hashlib
+import json
 import uuid
+import zlib
 import os
 import socket
+import random
+import threading
+import time
 import datetime
 import logging
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    # orjson has no PyPy build; the PyPy image falls back to the JIT-compiled stdlib encoder
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -16,138 +35,226 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)
 
+# Compress larger JSON bodies; tiny responses are not worth the CPU. Streamed
+# responses are left alone, compressing them would buffer the whole body, and
+# /jobs negotiates its own pre-compressed variant (see cache_put), which
+# Flask-Compress skips because Content-Encoding is already set
+app.config['COMPRESS_MIN_SIZE'] = 512
+app.config['COMPRESS_STREAMS'] = False
+app.config['COMPRESS_ALGORITHM'] = 'gzip'
+Compress(app)
+
+def _json_default(obj):
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, datetime.datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=datetime.timezone.utc)
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_bytes(obj) -> bytes:
+    # orjson serializes UUID and datetime natively, so rows need no per-field conversion
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC)
+    return json.dumps(obj, default=_json_default, separators=(',', ':'), ensure_ascii=False).encode()
+
+def ojsonify(obj, status=200):
+    return app.response_class(json_bytes(obj), status=status, mimetype='application/json')
+
+# Short-lived cache of serialized read responses, keyed by route. Each entry
+# holds the identity and gzip bodies with their own ETags, so a cache hit is
+# served (or answered with 304) without re-encoding or re-compressing
+_response_cache = TTLCache(maxsize=128, ttl=5)
+_cache_lock = threading.Lock()
+_cache_generation = 0
+
+def cache_get(key):
+    with _cache_lock:
+        return _response_cache.get(key)
+
+def cache_generation() -> int:
+    return _cache_generation
+
+def cache_put(key, body: bytes, generation: Optional[int] = None):
+    # A body read before the last invalidation is returned but not stored
+    etag = hashlib.md5(body).hexdigest()
+    entry = {
+        'identity': (body, etag),
+        'gzip': (gzip.compress(body), f"{etag}-gzip")
+    }
+    with _cache_lock:
+        if generation is None or generation == _cache_generation:
+            _response_cache[key] = entry
+    return entry
+
+def accepts_gzip() -> bool:
+    return request.accept_encodings['gzip'] > 0
+
+def conditional_response(body: bytes, etag: str, headers: Optional[Dict[str, str]] = None):
+    response = app.response_class(body, mimetype='application/json', headers=headers)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+def negotiated_response(entry):
+    if accepts_gzip():
+        body, etag = entry['gzip']
+        return conditional_response(body, etag, {'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'})
+    body, etag = entry['identity']
+    return conditional_response(body, etag, {'Vary': 'Accept-Encoding'})
+
+def invalidate_cache():
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _response_cache.clear()
+
 # Configuration
 CASSANDRA_HOST = os.getenv('CASSANDRA_HOST', 'cassandra.cassandra.svc.cluster.local')
 CASSANDRA_KEYSPACE = os.getenv('CASSANDRA_KEYSPACE', 'job_tracker')
 CASSANDRA_DC = os.getenv('CASSANDRA_DC', 'datacenter1')
 PORT = int(os.getenv('PORT', 5000))
+HOSTNAME = socket.gethostname()
+SAMPLE_REFRESH_INTERVAL = 30
+CONNECT_RETRY_INTERVAL = 10
+SAMPLE_SIZE = 1000
+JOBS_FETCH_SIZE = 500
+JOBS_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+INFO_RESPONSE = {
+    'service': 'Backend API',
+    'language': 'Python',
+    'framework': 'Flask',
+    'database': 'Cassandra',
+    'version': '1.0.0',
+    'pod': HOSTNAME,
+    'cassandra_host': CASSANDRA_HOST,
+    'keyspace': CASSANDRA_KEYSPACE,
+    'datacenter': CASSANDRA_DC
+}
+_INFO_BYTES = json_bytes(INFO_RESPONSE)
+_INFO_ETAG = hashlib.md5(_INFO_BYTES).hexdigest()
 
 # Global Cassandra session
 session = None
 
+JOB_COLUMNS = 'id, title, description, status, created_at, updated_at, assigned_to, priority'
+
 class CassandraManager:
     def __init__(self, contact_points: List[str], keyspace: str):
         self.contact_points = contact_points
         self.keyspace = keyspace
         self.cluster = None
         self.session = None
+        self._ps = {}
+        self._sample_ids: List[uuid.UUID] = []
+        self._refresh_stop = threading.Event()
+        self._refresh_thread = None
     
     def connect(self):
         try:
+            # Route each prepared statement straight to a replica in the local DC;
+            # rows come back as plain dicts ready for serialization
+            profile = ExecutionProfile(
+                load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy(local_dc=CASSANDRA_DC)),
+                request_timeout=5,
+                row_factory=dict_factory
+            )
             self.cluster = cassandra.cluster.Cluster(
                 contact_points=self.contact_points,
-                load_balancing_policy=cassandra.cluster.DCAwareRoundRobinPolicy(local_dc=CASSANDRA_DC)
+                execution_profiles={EXEC_PROFILE_DEFAULT: profile}
             )
-            self.session = self.cluster.connect()
+            # The keyspace and table are created by the schema-init Job (schema_init.py)
+            self.session = self.cluster.connect(self.keyspace)
+            self.prepare_statements()
             logger.info(f"Connected to Cassandra cluster at {self.contact_points}")
             return True
         except Exception as e:
             logger.error(f"Failed to connect to Cassandra: {e}")
             return False
     
-    def initialize_schema(self):
+    def prepare_statements(self):
+        self._ps['insert_job'] = self.session.prepare("""
+            INSERT INTO jobs (id, title, description, status, created_at, updated_at, assigned_to, priority)
+            VALUES (?, ?, ?, ?, toTimestamp(now()), toTimestamp(now()), ?, ?)
+        """)
+        self._ps['insert_job'].consistency_level = ConsistencyLevel.LOCAL_ONE
+        self._ps['select_all'] = self.session.prepare(f"SELECT {JOB_COLUMNS} FROM jobs")
+        self._ps['select_all'].fetch_size = JOBS_FETCH_SIZE
+        self._ps['select_ids'] = self.session.prepare(f"SELECT id FROM jobs LIMIT {SAMPLE_SIZE}")
+        self._ps['get_by_id'] = self.session.prepare(f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = ?")
+        for name in ('select_all', 'select_ids', 'get_by_id'):
+            self._ps[name].consistency_level = ConsistencyLevel.LOCAL_ONE
+        self._ps['ping'] = self.session.prepare("SELECT release_version FROM system.local")
+    
+    def refresh_sample_ids(self):
         try:
-            # Create keyspace
-            self.session.execute(f"""
-                CREATE KEYSPACE IF NOT EXISTS {self.keyspace}
-                WITH replication = {{'class': 'SimpleStrategy', 'replication_factor': 3}}
-            """)
-            
-            # Use keyspace
-            self.session.execute(f"USE {self.keyspace}")
-            
-            # Create jobs table
-            self.session.execute("""
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id UUID PRIMARY KEY,
-                    title TEXT,
-                    description TEXT,
-                    status TEXT,
-                    created_at TIMESTAMP,
-                    updated_at TIMESTAMP,
-                    assigned_to TEXT,
-                    priority INT
-                )
-            """)
-            
-            # Insert sample data if table is empty
-            result = self.session.execute("SELECT COUNT(*) FROM jobs")
-            if result[0].count == 0:
-                sample_jobs = [
-                    ('Database Migration', 'Migrate database to latest version', 'pending', 1),
-                    ('API Development', 'Develop REST API endpoints', 'in_progress', 2),
-                    ('Testing Suite', 'Create comprehensive test suite', 'pending', 3),
-                    ('Documentation', 'Write technical documentation', 'pending', 4),
-                    ('Performance Optimization', 'Optimize application performance', 'pending', 5)
-                ]
-                
-                for title, description, status, priority in sample_jobs:
-                    self.session.execute("""
-                        INSERT INTO jobs (id, title, description, status, created_at, updated_at, assigned_to, priority)
-                        VALUES (uuid(), %s, %s, %s, toTimestamp(now()), toTimestamp(now()), %s, %s)
-                    """, (title, description, status, 'unassigned', priority))
-                
-                logger.info("Sample jobs inserted into Cassandra")
-            
-            logger.info("Cassandra schema initialization completed")
-            return True
+            result = self.session.execute(self._ps['select_ids'])
+            self._sample_ids = [row['id'] for row in result]
         except Exception as e:
-            logger.error(f"Failed to initialize schema: {e}")
-            return False
+            logger.error(f"Failed to refresh sample job ids: {e}")
+    
+    def start_sample_refresh(self):
+        # A range scan every SAMPLE_REFRESH_INTERVAL seconds keeps GET / down to
+        # a single-partition read against a randomly chosen id
+        self.refresh_sample_ids()
+        
+        def refresh_loop():
+            while not self._refresh_stop.wait(SAMPLE_REFRESH_INTERVAL):
+                self.refresh_sample_ids()
+        
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(target=refresh_loop, name='sample-id-refresh', daemon=True)
+        self._refresh_thread.start()
     
     def get_random_job(self) -> Optional[Dict]:
         try:
-            result = self.session.execute("SELECT * FROM jobs LIMIT 5")
-            if result:
-                job = result[0]
-                return {
-                    'id': str(job.id),
-                    'title': job.title,
-                    'description': job.description,
-                    'status': job.status,
-                    'priority': job.priority,
-                    'assigned_to': job.assigned_to,
-                    'created_at': job.created_at.isoformat() if job.created_at else None,
-                    'updated_at': job.updated_at.isoformat() if job.updated_at else None
-                }
-            return None
+            # Refilling the sample is left to the background refresher; until it
+            # finds rows the route reports that no jobs exist
+            sample_ids = self._sample_ids
+            if not sample_ids:
+                return None
+            
+            # The default profile's request_timeout bounds how long result() can block
+            future = self.session.execute_async(self._ps['get_by_id'], (random.choice(sample_ids),))
+            return future.result().one()
         except Exception as e:
             logger.error(f"Failed to get random job: {e}")
             return None
     
-    def get_all_jobs(self) -> List[Dict]:
-        try:
-            result = self.session.execute("SELECT * FROM jobs")
-            jobs = []
-            for job in result:
-                jobs.append({
-                    'id': str(job.id),
-                    'title': job.title,
-                    'description': job.description,
-                    'status': job.status,
-                    'priority': job.priority,
-                    'assigned_to': job.assigned_to,
-                    'created_at': job.created_at.isoformat() if job.created_at else None,
-                    'updated_at': job.updated_at.isoformat() if job.updated_at else None
-                })
-            return jobs
-        except Exception as e:
-            logger.error(f"Failed to get all jobs: {e}")
-            return []
+    def get_all_jobs(self) -> ResultSet:
+        # Only the first JOBS_FETCH_SIZE rows are fetched here; callers page
+        # through the rest with fetch_next_page(). Errors propagate so a failed
+        # read is never mistaken for (and cached as) an empty table
+        future = self.session.execute_async(self._ps['select_all'])
+        return future.result()
     
     def create_job(self, title: str, description: str, status: str = 'pending', 
                   assigned_to: str = 'unassigned', priority: int = 1) -> bool:
         try:
-            self.session.execute("""
-                INSERT INTO jobs (id, title, description, status, created_at, updated_at, assigned_to, priority)
-                VALUES (uuid(), %s, %s, %s, toTimestamp(now()), toTimestamp(now()), %s, %s)
-            """, (title, description, status, assigned_to, priority))
+            job_id = uuid.uuid4()
+            self.session.execute(
+                self._ps['insert_job'],
+                (job_id, title, description, status, assigned_to, priority)
+            )
+            # Make the new job selectable by GET / before the next refresh
+            if len(self._sample_ids) < SAMPLE_SIZE:
+                self._sample_ids = self._sample_ids + [job_id]
             return True
         except Exception as e:
             logger.error(f"Failed to create job: {e}")
             return False
     
+    def ping(self) -> bool:
+        # Reads the contacted node's own system table: no scan, no replica fan-out
+        try:
+            return self.session.execute(self._ps['ping'], timeout=1.0).one() is not None
+        except Exception as e:
+            logger.error(f"Cassandra ping failed: {e}")
+            return False
+    
     def shutdown(self):
+        self._refresh_stop.set()
         if self.cluster:
             self.cluster.shutdown()
             logger.info("Cassandra connection closed")
@@ -155,27 +262,58 @@ class CassandraManager:
 # Initialize Cassandra
 cassandra_manager = CassandraManager([CASSANDRA_HOST], CASSANDRA_KEYSPACE)
 
-@app.before_first_request
+# Cluster/Session objects must never be shared across forked workers, so each
+# process connects from gunicorn's post_fork hook, or lazily on a later request
+# if that attempt failed. Retries are spaced CONNECT_RETRY_INTERVAL seconds apart
+# and only one thread attempts at a time; the others fail fast instead of queueing.
+# The request path only reads a boolean; a forked child starts over unconnected
+_init_lock = threading.Lock()
+_initialized = False
+_init_last_attempt = None
+
+def _reset_init_state():
+    global _init_lock, _initialized, _init_last_attempt
+    _init_lock = threading.Lock()
+    _initialized = False
+    _init_last_attempt = None
+
+os.register_at_fork(after_in_child=_reset_init_state)
+
+def _init_backing_off() -> bool:
+    return _init_last_attempt is not None and time.monotonic() - _init_last_attempt < CONNECT_RETRY_INTERVAL
+
+@app.before_request
 def initialize_cassandra():
-    if not cassandra_manager.connect():
-        logger.error("Failed to connect to Cassandra on startup")
-        return False
-    
-    if not cassandra_manager.initialize_schema():
-        logger.error("Failed to initialize Cassandra schema")
-        return False
+    global _initialized, _init_last_attempt
+    if _initialized or _init_backing_off():
+        return
     
-    logger.info("Cassandra initialization completed successfully")
-    return True
+    if not _init_lock.acquire(blocking=False):
+        return
+    try:
+        if _initialized or _init_backing_off():
+            return
+        
+        _init_last_attempt = time.monotonic()
+        if not cassandra_manager.connect():
+            logger.error(f"Failed to connect to Cassandra, retrying in {CONNECT_RETRY_INTERVAL}s")
+            cassandra_manager.shutdown()
+            return
+        
+        cassandra_manager.start_sample_refresh()
+        _initialized = True
+        logger.info("Cassandra initialization completed successfully")
+    finally:
+        _init_lock.release()
 
 @app.route('/')
 def get_random_job():
     try:
         job = cassandra_manager.get_random_job()
         if job:
-            return jsonify({
+            return ojsonify({
                 'job': job,
-                'pod': socket.gethostname(),
+                'pod': HOSTNAME,
                 'pod_ip': request.host.split(':')[0],
                 'database': 'Cassandra',
                 'cluster_info': {
@@ -184,9 +322,9 @@ def get_random_job():
                 }
             })
         else:
-            return jsonify({
+            return ojsonify({
                 'job': {'title': 'No jobs found', 'description': 'Database is empty'},
-                'pod': socket.gethostname(),
+                'pod': HOSTNAME,
                 'pod_ip': request.host.split(':')[0],
                 'database': 'Cassandra',
                 'cluster_info': {
@@ -196,25 +334,92 @@ def get_random_job():
             })
     except Exception as e:
         logger.error(f"Error in get_random_job: {e}")
-        return jsonify({
+        return ojsonify({
             'error': 'Failed to fetch job from database',
-            'pod': socket.gethostname(),
+            'pod': HOSTNAME,
             'pod_ip': request.host.split(':')[0]
-        }), 500
+        }, status=500)
+
+def jobs_json_chunks(pages):
+    # Serialize one page at a time; 'total' goes last once every page is counted
+    yield b'{"pod":' + json_bytes(HOSTNAME) + b',"language":"Python","jobs":['
+    total = 0
+    for page in pages:
+        if page:
+            chunk = json_bytes(page)[1:-1]
+            yield b',' + chunk if total else chunk
+            total += len(page)
+    yield b'],"total":' + str(total).encode() + b'}'
+
+def result_pages(result: ResultSet, fetched: List[List[Dict]]):
+    yield from fetched
+    while result.has_more_pages:
+        result.fetch_next_page()
+        yield result.current_rows
+
+def stream_jobs(pages, use_gzip: bool, generation: int):
+    # Memory is bounded by the fetch size rather than the table size. The body is
+    # also kept for the cache while it stays under JOBS_CACHE_MAX_BYTES, so tables
+    # up to that size get the same 5s cache as single-page results; larger ones
+    # are re-read on every request rather than held in memory
+    compressor = zlib.compressobj(wbits=31) if use_gzip else None
+    kept, kept_size = [], 0
+    try:
+        for chunk in jobs_json_chunks(pages):
+            if kept is not None:
+                kept_size += len(chunk)
+                if kept_size <= JOBS_CACHE_MAX_BYTES:
+                    kept.append(chunk)
+                else:
+                    kept = None
+            if compressor:
+                chunk = compressor.compress(chunk)
+                if not chunk:
+                    continue
+            yield chunk
+        if compressor:
+            yield compressor.flush()
+    except Exception as e:
+        # The 200 status is already sent. Re-raising aborts the chunked response
+        # without its terminating chunk, so HTTP clients see an incomplete body
+        # (httpx raises RemoteProtocolError) instead of a complete-looking one
+        logger.error(f"Error streaming jobs: {e}")
+        raise
+    
+    if kept is not None:
+        cache_put('jobs', b''.join(kept), generation)
 
 @app.route('/jobs')
 def get_all_jobs():
     try:
-        jobs = cassandra_manager.get_all_jobs()
-        return jsonify({
-            'jobs': jobs,
-            'total': len(jobs),
-            'pod': socket.gethostname(),
-            'language': 'Python'
-        })
+        entry = cache_get('jobs')
+        if entry is None:
+            generation = cache_generation()
+            result = cassandra_manager.get_all_jobs()
+            pages = [result.current_rows]
+            if result.has_more_pages:
+                # Fetch the second page before committing to a 200, so the most
+                # likely paging failures still produce a proper 500
+                result.fetch_next_page()
+                pages.append(result.current_rows)
+            
+            if result.has_more_pages:
+                headers = {'Vary': 'Accept-Encoding'}
+                use_gzip = accepts_gzip()
+                if use_gzip:
+                    headers['Content-Encoding'] = 'gzip'
+                return app.response_class(
+                    stream_jobs(result_pages(result, pages), use_gzip, generation),
+                    mimetype='application/json',
+                    headers=headers
+                )
+            
+            # Everything is already in memory: serialize it once and cache it
+            entry = cache_put('jobs', b''.join(jobs_json_chunks(pages)), generation)
+        return negotiated_response(entry)
     except Exception as e:
         logger.error(f"Error in get_all_jobs: {e}")
-        return jsonify({'error': 'Failed to fetch jobs'}), 500
+        return ojsonify({'error': 'Failed to fetch jobs'}, status=500)
 
 @app.route('/jobs', methods=['POST'])
 def create_job():
@@ -222,7 +427,7 @@ def create_job():
         data = request.get_json()
         
         if not data or not data.get('title') or not data.get('description'):
-            return jsonify({'error': 'Title and description are required'}), 400
+            return ojsonify({'error': 'Title and description are required'}, status=400)
         
         title = data['title']
         description = data['description']
@@ -231,67 +436,49 @@ def create_job():
         priority = data.get('priority', 1)
         
         if cassandra_manager.create_job(title, description, status, assigned_to, priority):
-            return jsonify({
+            invalidate_cache()
+            return ojsonify({
                 'message': 'Job created successfully',
-                'pod': socket.gethostname(),
+                'pod': HOSTNAME,
                 'language': 'Python'
             })
         else:
-            return jsonify({'error': 'Failed to create job'}), 500
+            return ojsonify({'error': 'Failed to create job'}, status=500)
     except Exception as e:
         logger.error(f"Error in create_job: {e}")
-        return jsonify({'error': 'Failed to create job'}), 500
+        return ojsonify({'error': 'Failed to create job'}, status=500)
 
 @app.route('/health')
 def health_check():
     try:
         # Test Cassandra connection
-        job = cassandra_manager.get_random_job()
-        db_status = 'connected' if job is not None else 'disconnected'
+        db_status = 'connected' if cassandra_manager.ping() else 'disconnected'
         
-        return jsonify({
+        return ojsonify({
             'status': 'healthy',
-            'pod': socket.gethostname(),
-            'timestamp': datetime.datetime.utcnow().isoformat(),
+            'pod': HOSTNAME,
+            'timestamp': datetime.datetime.utcnow(),
             'database': db_status,
             'language': 'Python',
             'version': '1.0.0'
         })
     except Exception as e:
         logger.error(f"Error in health_check: {e}")
-        return jsonify({
+        return ojsonify({
             'status': 'unhealthy',
-            'pod': socket.gethostname(),
-            'timestamp': datetime.datetime.utcnow().isoformat(),
+            'pod': HOSTNAME,
+            'timestamp': datetime.datetime.utcnow(),
             'database': 'disconnected',
             'language': 'Python',
             'error': str(e)
-        }), 500
+        }, status=500)
 
 @app.route('/info')
 def get_info():
-    return jsonify({
-        'service': 'Backend API',
-        'language': 'Python',
-        'framework': 'Flask',
-        'database': 'Cassandra',
-        'version': '1.0.0',
-        'pod': socket.gethostname(),
-        'cassandra_host': CASSANDRA_HOST,
-        'keyspace': CASSANDRA_KEYSPACE,
-        'datacenter': CASSANDRA_DC
-    })
+    return conditional_response(_INFO_BYTES, _INFO_ETAG, {'Cache-Control': 'public, max-age=60'})
 
 if __name__ == '__main__':
-    # Initialize Cassandra before starting the server
-    if not cassandra_manager.connect():
-        logger.error("Failed to connect to Cassandra. Exiting...")
-        exit(1)
-    
-    if not cassandra_manager.initialize_schema():
-        logger.error("Failed to initialize Cassandra schema. Exiting...")
-        exit(1)
-    
+    # Development server only; Cassandra is connected on the first request
     logger.info(f"Starting Python backend server on port {PORT}")
     logger.info(f"Cassandra host: {CASSANDRA_HOST}")
     logger.info(f"Keyspace: {CASSANDRA_KEYSPACE}")
@@ -0,0 +1,40 @@
+import os
+import socket
+import zlib
+
+bind = '0.0.0.0:5000'
+workers = 4
+worker_class = 'gthread'
+threads = 8
+timeout = 120
+
+# Pinning only pays off when the container owns its cores exclusively
+# (Guaranteed QoS with whole-CPU limits under the static CPU manager policy).
+# Burstable pods, like the manifests in this repo, see every CPU on the node,
+# so pinning there would stack all pods onto the same cores. Off by default
+PIN_WORKER_CPUS = os.getenv('PIN_WORKER_CPUS', 'false').lower() == 'true'
+
+def pre_fork(server, worker):
+    # Pin each worker to one core so the driver's reactor thread is not
+    # migrated between CPUs. Choose in the master, where server.WORKERS holds
+    # only live workers, so a replacement takes the core its dead predecessor
+    # left free. Start from a hostname-derived offset so pods sharing a mask
+    # do not all begin at the same core
+    worker.cpu = None
+    if not PIN_WORKER_CPUS:
+        return
+    cpus = sorted(os.sched_getaffinity(0))
+    offset = zlib.crc32(socket.gethostname().encode()) % len(cpus)
+    cpus = cpus[offset:] + cpus[:offset]
+    in_use = [w.cpu for w in server.WORKERS.values() if getattr(w, 'cpu', None) in cpus]
+    worker.cpu = min(cpus, key=in_use.count)
+
+def post_fork(server, worker):
+    if worker.cpu is not None:
+        os.sched_setaffinity(0, {worker.cpu})
+        server.log.info(f"Worker {worker.pid} pinned to CPU {worker.cpu}")
+
+    # Build this worker's own Cluster/Session and prepared statements now
+    # instead of on its first request; never inherited across fork
+    from app import initialize_cassandra
+    initialize_cassandra()
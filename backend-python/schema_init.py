@@ -0,0 +1,86 @@
+import cassandra.cluster
+from cassandra.concurrent import execute_concurrent_with_args
+from cassandra.policies import DCAwareRoundRobinPolicy
+import uuid
+import os
+import sys
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Configuration
+CASSANDRA_HOST = os.getenv('CASSANDRA_HOST', 'cassandra.cassandra.svc.cluster.local')
+CASSANDRA_KEYSPACE = os.getenv('CASSANDRA_KEYSPACE', 'job_tracker')
+CASSANDRA_DC = os.getenv('CASSANDRA_DC', 'datacenter1')
+CASSANDRA_RF = int(os.getenv('CASSANDRA_RF', '1'))
+
+SAMPLE_JOBS = [
+    ('Database Migration', 'Migrate database to latest version', 'pending', 1),
+    ('API Development', 'Develop REST API endpoints', 'in_progress', 2),
+    ('Testing Suite', 'Create comprehensive test suite', 'pending', 3),
+    ('Documentation', 'Write technical documentation', 'pending', 4),
+    ('Performance Optimization', 'Optimize application performance', 'pending', 5)
+]
+
+def sample_job_id(title: str) -> uuid.UUID:
+    # Stable ids make re-running the Job a no-op for rows that already exist
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"{CASSANDRA_KEYSPACE}/sample-jobs/{title}")
+
+def initialize_schema(session):
+    # Create keyspace
+    session.execute(f"""
+        CREATE KEYSPACE IF NOT EXISTS {CASSANDRA_KEYSPACE}
+        WITH replication = {{'class': 'NetworkTopologyStrategy', '{CASSANDRA_DC}': {CASSANDRA_RF}}}
+    """)
+
+    session.set_keyspace(CASSANDRA_KEYSPACE)
+
+    # Create jobs table
+    session.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id UUID PRIMARY KEY,
+            title TEXT,
+            description TEXT,
+            status TEXT,
+            created_at TIMESTAMP,
+            updated_at TIMESTAMP,
+            assigned_to TEXT,
+            priority INT
+        )
+    """)
+
+    # Seed sample jobs; IF NOT EXISTS keeps existing rows untouched. Conditional
+    # inserts on different partitions cannot share a batch, so they run concurrently
+    insert_job = session.prepare("""
+        INSERT INTO jobs (id, title, description, status, created_at, updated_at, assigned_to, priority)
+        VALUES (?, ?, ?, ?, toTimestamp(now()), toTimestamp(now()), ?, ?)
+        IF NOT EXISTS
+    """)
+    params = [
+        (sample_job_id(title), title, description, status, 'unassigned', priority)
+        for title, description, status, priority in SAMPLE_JOBS
+    ]
+    execute_concurrent_with_args(session, insert_job, params, concurrency=50, raise_on_first_error=True)
+    logger.info("Sample jobs seeded into Cassandra")
+
+def main() -> int:
+    cluster = cassandra.cluster.Cluster(
+        contact_points=[CASSANDRA_HOST],
+        load_balancing_policy=DCAwareRoundRobinPolicy(local_dc=CASSANDRA_DC)
+    )
+    try:
+        session = cluster.connect()
+        logger.info(f"Connected to Cassandra cluster at {CASSANDRA_HOST}")
+        initialize_schema(session)
+        logger.info("Cassandra schema initialization completed")
+        return 0
+    except Exception as e:
+        logger.error(f"Failed to initialize schema: {e}")
+        return 1
+    finally:
+        cluster.shutdown()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -175,6 +175,12 @@ deploy_applications() {
     local lang=$1
     log_info "Deploying $lang application services..."
     
+    # backend-service-$lang.yaml and frontend-service-$lang.yaml are not
+    # checked in; write them before anything below applies them
+    if [ "$lang" != "all" ]; then
+        create_language_specific_manifests $lang
+    fi
+    
     case $lang in
         "nodejs")
             log_info "Deploying Node.js backend service..."
@@ -186,6 +192,11 @@ deploy_applications() {
             kubectl wait --for=condition=available deployment/frontend-deployment --timeout=300s
             ;;
         "python")
+            log_info "Initializing Cassandra schema..."
+            kubectl delete job cassandra-schema-init --ignore-not-found=true
+            kubectl apply -f schema-init-job.yaml
+            kubectl wait --for=condition=complete job/cassandra-schema-init --timeout=300s
+            
             log_info "Deploying Python backend service..."
             kubectl apply -f backend-service-python.yaml
             kubectl wait --for=condition=available deployment/backend-deployment-python --timeout=300s
@@ -413,10 +424,14 @@ show_access_info() {
 cleanup() {
     local lang=$1
     log_warning "Cleaning up $lang deployment..."
+    create_language_specific_manifests $lang
     
     # Delete applications
     kubectl delete -f frontend-service-$lang.yaml --ignore-not-found=true
     kubectl delete -f backend-service-$lang.yaml --ignore-not-found=true
+    if [ "$lang" = "python" ]; then
+        kubectl delete -f schema-init-job.yaml --ignore-not-found=true
+    fi
     
     # Wait for cleanup
     kubectl wait --for=delete pod -l language=$lang --timeout=300s || true
@@ -479,13 +494,11 @@ case $COMMAND in
         
         if [ "$LANGUAGE" = "all" ]; then
             for lang in "${LANGUAGES[@]}"; do
-                create_language_specific_manifests $lang
                 deploy_applications $lang
                 verify_deployment $lang
                 show_access_info $lang
             done
         else
-            create_language_specific_manifests $LANGUAGE
             deploy_applications $LANGUAGE
             verify_deployment $LANGUAGE
             show_access_info $LANGUAGE
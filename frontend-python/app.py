@@ -1,5 +1,7 @@
-from flask import Flask, render_template, request, jsonify
-import requests
+from quart import Quart, render_template, request
+import orjson
+import httpx
+import hashlib
 import os
 import socket
 import logging
@@ -9,103 +11,137 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+app = Quart(__name__)
+
+def ojsonify(obj, status=200):
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
 
 # Configuration
 BACKEND_URL = os.getenv('BACKEND_URL', 'http://backend-service:5000')
 PORT = int(os.getenv('PORT', 8080))
+HOSTNAME = socket.gethostname()
+
+INFO_RESPONSE = {
+    'service': 'Frontend Application',
+    'language': 'Python',
+    'framework': 'Quart',
+    'version': '1.0.0',
+    'pod': HOSTNAME,
+    'backend_url': BACKEND_URL
+}
+_INFO_BYTES = orjson.dumps(INFO_RESPONSE)
+_INFO_ETAG = hashlib.md5(_INFO_BYTES).hexdigest()
 
 class BackendService:
     def __init__(self, base_url):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.timeout = 10
+        self.client = None
+    
+    async def start(self):
+        # One pooled client per worker event loop, multiplexing every in-flight
+        # backend call; the transport retries failed connection attempts
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+            retries=2
+        )
+        self.client = httpx.AsyncClient(base_url=self.base_url, transport=transport, timeout=10.0)
     
-    def get_random_job(self):
+    async def close(self):
+        if self.client:
+            await self.client.aclose()
+    
+    async def get_random_job(self):
         try:
-            response = self.session.get(f"{self.base_url}/")
+            response = await self.client.get("/")
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Error fetching random job: {e}")
             return None
     
-    def get_all_jobs(self):
+    async def get_all_jobs(self):
         try:
-            response = self.session.get(f"{self.base_url}/jobs")
+            response = await self.client.get("/jobs")
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Error fetching all jobs: {e}")
             return None
     
-    def create_job(self, job_data):
+    async def create_job(self, job_data):
         try:
-            response = self.session.post(f"{self.base_url}/jobs", json=job_data)
+            response = await self.client.post("/jobs", json=job_data)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Error creating job: {e}")
             return None
     
-    def get_health(self):
+    async def get_health(self):
         try:
-            response = self.session.get(f"{self.base_url}/health")
+            response = await self.client.get("/health")
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Error checking backend health: {e}")
             return None
 
 backend_service = BackendService(BACKEND_URL)
 
+@app.before_serving
+async def start_backend_client():
+    await backend_service.start()
+
+@app.after_serving
+async def close_backend_client():
+    await backend_service.close()
+
 @app.route('/')
-def index():
-    return render_template('index.html')
+async def index():
+    return await render_template('index.html')
 
 @app.route('/api/job')
-def api_get_job():
-    data = backend_service.get_random_job()
+async def api_get_job():
+    data = await backend_service.get_random_job()
     if data:
-        return jsonify(data)
-    return jsonify({'error': 'Failed to fetch job from backend'}), 500
+        return ojsonify(data)
+    return ojsonify({'error': 'Failed to fetch job from backend'}, status=500)
 
 @app.route('/api/jobs')
-def api_get_jobs():
-    data = backend_service.get_all_jobs()
+async def api_get_jobs():
+    data = await backend_service.get_all_jobs()
     if data:
-        return jsonify(data)
-    return jsonify({'error': 'Failed to fetch jobs from backend'}), 500
+        return ojsonify(data)
+    return ojsonify({'error': 'Failed to fetch jobs from backend'}, status=500)
 
 @app.route('/api/jobs', methods=['POST'])
-def api_create_job():
-    job_data = request.get_json()
+async def api_create_job():
+    job_data = await request.get_json()
     if not job_data:
-        return jsonify({'error': 'No job data provided'}), 400
+        return ojsonify({'error': 'No job data provided'}, status=400)
     
-    data = backend_service.create_job(job_data)
+    data = await backend_service.create_job(job_data)
     if data:
-        return jsonify(data)
-    return jsonify({'error': 'Failed to create job'}), 500
+        return ojsonify(data)
+    return ojsonify({'error': 'Failed to create job'}, status=500)
 
 @app.route('/api/health')
-def api_health():
-    data = backend_service.get_health()
+async def api_health():
+    data = await backend_service.get_health()
     if data:
-        return jsonify(data)
-    return jsonify({'error': 'Backend service unavailable'}), 500
+        return ojsonify(data)
+    return ojsonify({'error': 'Backend service unavailable'}, status=500)
 
 @app.route('/api/info')
-def api_info():
-    hostname = socket.gethostname()
-    return jsonify({
-        'service': 'Frontend Application',
-        'language': 'Python',
-        'framework': 'Flask',
-        'version': '1.0.0',
-        'pod': hostname,
-        'backend_url': BACKEND_URL
-    })
+async def api_info():
+    if request.if_none_match.contains(_INFO_ETAG):
+        response = app.response_class(b'', status=304)
+    else:
+        response = app.response_class(_INFO_BYTES, mimetype='application/json')
+    response.set_etag(_INFO_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
 
 if __name__ == '__main__':
     logger.info(f"Starting Python frontend server on port {PORT}")